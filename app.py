@@ -1,18 +1,52 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, send_file, send_from_directory
+from flask_compress import Compress
+from werkzeug.exceptions import HTTPException
+import orjson
 import sqlite3
 from datetime import datetime
 import os
+import io
+import logging
+import re
+import string
+import sys
+import hashlib
+import queue
+import threading
+import time
 from gtts import gTTS
 import tempfile
 from dotenv import load_dotenv
 import requests
-import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from itertools import accumulate
+from requests.adapters import HTTPAdapter
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 
+# Compress JSON responses, preferring brotli. text/html is left out: Flask-Compress
+# buffers the body and rewrites the ETag, which would defeat /web's sendfile
+# path and its 304 responses.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
+logger = logging.getLogger('careermate')
+logger.setLevel(os.getenv('LOGLEVEL', 'INFO').upper())
+
+# Concurrent chunk translations per process, shared by all in-flight requests.
+# Size it for the expected number of concurrent translated requests times
+# their chunks; under gevent these are greenlets, so a large pool is cheap.
+TRANSLATION_WORKERS = int(os.getenv('TRANSLATION_WORKERS', 64))
+
+# Shared HTTP session so translation calls reuse TCP/TLS connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=TRANSLATION_WORKERS))
+
 # Language configurations
 LANGUAGES = {
     'en': {'name': 'English', 'tts_lang': 'en'},
@@ -21,19 +55,48 @@ LANGUAGES = {
     'kn': {'name': 'ಕನ್ನಡ', 'tts_lang': 'hi'}
 }
 
+# Synthesized speech, content-addressed by voice and text
+TTS_CACHE_DIR = os.path.join(app.root_path, 'cache', 'tts')
+
+# One SQLite connection per thread, opened on first use
+_db_local = threading.local()
+
+def save_tts_cache(cache_path, audio):
+    """Atomically write synthesized audio into the TTS cache"""
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3', dir=TTS_CACHE_DIR) as temp_file:
+            temp_file.write(audio)
+        os.replace(temp_file.name, cache_path)
+    except Exception as e:
+        logger.error("❌ TTS cache write error: %s", e)
+
 def get_db_connection():
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None:
+        return conn
     try:
         conn = sqlite3.connect('careermate.db')
         conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        _db_local.conn = conn
         return conn
     except Exception as e:
-        print(f"Database connection error: {e}")
+        logger.error("Database connection error: %s", e)
         return None
 
+def close_db_connection():
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _db_local.conn = None
+
 def init_database():
     try:
         conn = get_db_connection()
         if conn:
+            conn.execute('PRAGMA journal_mode=WAL')
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS chats (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -42,162 +105,346 @@ def init_database():
                     timestamp TEXT NOT NULL
                 )
             ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS translations (
+                    lang TEXT NOT NULL,
+                    src_hash TEXT NOT NULL,
+                    tgt TEXT NOT NULL,
+                    PRIMARY KEY (lang, src_hash)
+                )
+            ''')
             conn.commit()
-            conn.close()
-            print("✅ Database initialized successfully")
+            # The startup thread has no further use for its connection
+            close_db_connection()
+            logger.info("✅ Database initialized successfully")
+    except Exception as e:
+        logger.error("Database initialization error: %s", e)
+
+def run_blocking(fn, *args):
+    """Run blocking SQLite work; under gevent it goes to the hub's native threadpool"""
+    # sqlite3 is a C extension that monkey-patching can't make cooperative, so
+    # calling it from a greenlet would stall every request in the worker
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args)
+    return fn(*args)
+
+# Chat rows waiting to be written by the background writer
+WRITE_QUEUE = queue.Queue()
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_TIMEOUT = 0.05
+_writer_lock = threading.Lock()
+_writer_thread = None
+
+def _drain_chat_writes():
+    """Write queued chats in batches over one long-lived connection"""
+    global _writer_thread
+    try:
+        conn = sqlite3.connect('careermate.db', check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+    except Exception as e:
+        logger.error("❌ Chat writer could not open the database: %s", e)
+        # Let the next save_chat start a fresh writer; queued rows are kept
+        with _writer_lock:
+            _writer_thread = None
+        return
+    while True:
+        batch = [WRITE_QUEUE.get()]
+        deadline = time.monotonic() + WRITE_BATCH_TIMEOUT
+        while len(batch) < WRITE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(WRITE_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            run_blocking(_write_chat_batch, conn, batch)
+        except Exception as e:
+            logger.error("❌ Database error: %s", e)
+
+def _write_chat_batch(conn, batch):
+    conn.executemany(
+        'INSERT INTO chats (user_message, bot_response, timestamp) VALUES (?, ?, ?)',
+        batch
+    )
+    conn.commit()
+
+def save_chat(user_message, bot_response, timestamp):
+    """Queue a chat for the background writer, starting it on first use"""
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(target=_drain_chat_writes, daemon=True)
+                _writer_thread.start()
+    WRITE_QUEUE.put((user_message, bot_response, timestamp))
+
+def get_cached_translation(lang, src_hash):
+    """Look up a previously translated chunk"""
+    try:
+        conn = get_db_connection()
+        if conn:
+            row = conn.execute(
+                'SELECT tgt FROM translations WHERE lang = ? AND src_hash = ?',
+                (lang, src_hash)
+            ).fetchone()
+            return row['tgt'] if row else None
     except Exception as e:
-        print(f"Database initialization error: {e}")
+        logger.error("❌ Translation cache read error: %s", e)
+    return None
+
+def save_cached_translation(lang, src_hash, tgt):
+    """Store a translated chunk for reuse"""
+    try:
+        conn = get_db_connection()
+        if conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO translations (lang, src_hash, tgt) VALUES (?, ?, ?)',
+                (lang, src_hash, tgt)
+            )
+            conn.commit()
+    except Exception as e:
+        logger.error("❌ Translation cache write error: %s", e)
+
+# Chunks MyMemory recently failed to translate: (lang, src_hash) -> expiry time
+NEG_CACHE = {}
+NEG_CACHE_TTL = 300
+NEG_CACHE_MAX = 1024
+
+def _remember_failed_chunk(key):
+    now = time.time()
+    if len(NEG_CACHE) >= NEG_CACHE_MAX:
+        for stale_key, expiry in list(NEG_CACHE.items()):
+            if expiry <= now:
+                NEG_CACHE.pop(stale_key, None)
+    NEG_CACHE[key] = now + NEG_CACHE_TTL
 
 def translate_single_chunk(text, target):
-    """Translate a single chunk of text"""
+    """Translate a single chunk of text, returning (text, translated_ok)"""
     try:
         if len(text.strip()) == 0:
-            return text
+            return text, True
+        
+        src_hash = hashlib.blake2b(text.strip().encode(), digest_size=16).hexdigest()
+        cached = run_blocking(get_cached_translation, target, src_hash)
+        if cached is not None:
+            return cached, True
         
-        encoded_text = urllib.parse.quote(text.strip())
-        url = f"https://api.mymemory.translated.net/get?q={encoded_text}&langpair=en|{target}"
+        # Skip chunks that just failed, e.g. while the daily quota is used up
+        if NEG_CACHE.get((target, src_hash), 0) > time.time():
+            return text, False
         
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(
+            'https://api.mymemory.translated.net/get',
+            params={'q': text.strip(), 'langpair': f'en|{target}'},
+            timeout=10
+        )
         
         if response.status_code == 200:
             data = response.json()
-            if 'responseData' in data and 'translatedText' in data['responseData']:
-                return data['responseData']['translatedText']
+            # Quota and other API errors come back as HTTP 200 with an error status
+            if str(data.get('responseStatus', 200)) == '200' and 'translatedText' in data.get('responseData', {}):
+                # An unchanged result is still valid (brand names, numbers, links)
+                translated = data['responseData']['translatedText']
+                run_blocking(save_cached_translation, target, src_hash, translated)
+                return translated, True
         
-        return text
+        _remember_failed_chunk((target, src_hash))
+        return text, False
             
     except Exception as e:
-        print(f"❌ Chunk translation error: {e}")
-        return text
-
-def translate_text_smart(text, target_language='en'):
-    """Smart translation with better chunking"""
+        logger.error("❌ Chunk translation error: %s", e)
+        return text, False
+
+# Long-lived translation workers, so each keeps its SQLite connection
+TRANSLATION_EXECUTOR = ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS)
+
+# Chunk boundaries for translation: blank lines, bullets, sentence ends
+PARAGRAPH_RE = re.compile(r'\n{2,}')
+BULLET_RE = re.compile(r'(?=•)')
+# Only spaces and tabs, so line breaks inside a paragraph survive rejoining
+SENT_RE = re.compile(r'(?<=[.!?])[ \t]+')
+
+# Longest text sent to MyMemory in one request
+CHUNK_LIMIT = 250
+
+def _pack_chunks(parts, sep):
+    """Greedily pack consecutive parts into chunks of at most CHUNK_LIMIT chars"""
+    # ends[i] is the joined length of parts[:i + 1], plus one trailing separator
+    ends = list(accumulate(len(part) + len(sep) for part in parts))
+    chunks = []
+    start = 0
+    while start < len(parts):
+        base = ends[start - 1] if start else 0
+        # Binary search for the longest run that fits; an oversized part goes alone
+        end = max(bisect_right(ends, base + CHUNK_LIMIT + len(sep), lo=start), start + 1)
+        chunk = sep.join(parts[start:end])
+        if chunk.strip():
+            chunks.append(chunk)
+        start = end
+    return chunks
+
+def translate_text_checked(text, target_language='en'):
+    """Smart translation with better chunking, returning (text, complete); complete is False if any chunk failed"""
     if target_language == 'en' or not text.strip():
-        return text
+        return text, True
         
     try:
         lang_map = {'hi': 'hi', 'pa': 'pa', 'kn': 'kn', 'en': 'en'}
         target = lang_map.get(target_language, 'en')
         
         # For short text, translate directly
-        if len(text) <= 250:
+        if len(text) <= CHUNK_LIMIT:
             return translate_single_chunk(text, target)
         
         # For longer text, split smartly
         chunks = []
         
-        # Split by double newlines (paragraphs)
-        paragraphs = text.split('\n\n')
+        # Split by blank lines (paragraphs)
+        paragraphs = PARAGRAPH_RE.split(text)
         
         for paragraph in paragraphs:
-            if len(paragraph) <= 250:
+            if len(paragraph) <= CHUNK_LIMIT:
                 chunks.append(paragraph)
             else:
-                # Split by bullet points
+                # Split by bullet points, else by sentences
                 if '•' in paragraph:
-                    parts = paragraph.split('•')
-                    current_chunk = parts[0]
-                    for part in parts[1:]:
-                        if len(current_chunk + '•' + part) <= 250:
-                            current_chunk += '•' + part
-                        else:
-                            if current_chunk.strip():
-                                chunks.append(current_chunk)
-                            current_chunk = '•' + part
-                    if current_chunk.strip():
-                        chunks.append(current_chunk)
+                    chunks.extend(_pack_chunks(BULLET_RE.split(paragraph), ''))
                 else:
-                    # Split by sentences
-                    sentences = paragraph.replace('. ', '.|').split('|')
-                    current_chunk = ''
-                    for sentence in sentences:
-                        if len(current_chunk + sentence) <= 250:
-                            current_chunk += sentence
-                        else:
-                            if current_chunk.strip():
-                                chunks.append(current_chunk)
-                            current_chunk = sentence
-                    if current_chunk.strip():
-                        chunks.append(current_chunk)
+                    chunks.extend(_pack_chunks(SENT_RE.split(paragraph), ' '))
         
-        # Translate each chunk
-        translated_parts = []
-        for chunk in chunks:
-            if chunk.strip():
-                translated = translate_single_chunk(chunk, target)
-                translated_parts.append(translated)
+        # Translate all chunks in parallel
+        chunks = [chunk for chunk in chunks if chunk.strip()]
+        if not chunks:
+            return text, True
+        # Translate each distinct chunk once, then map back in order
+        unique_chunks = list(dict.fromkeys(chunks))
+        translated = dict(zip(unique_chunks, TRANSLATION_EXECUTOR.map(lambda chunk: translate_single_chunk(chunk, target), unique_chunks)))
+        translated_parts = [translated[chunk][0] for chunk in chunks]
+        complete = all(ok for _, ok in translated.values())
         
-        return '\n\n'.join(translated_parts)
+        return '\n\n'.join(translated_parts), complete
                 
     except Exception as e:
-        print(f"Translation error: {e}")
-        return text
+        logger.error("Translation error: %s", e)
+        return text, False
+
+# More comprehensive word lists
+GREETING_WORDS = [
+    'hi', 'hello', 'hey', 'start', 'namaste', 'namaskar', 'hola', 'bonjour',
+    'नमस्ते', 'नमस्कार', 'ਸਤ ਸ੍ਰੀ ਅਕਾਲ', 'ਨਮਸਕਾਰ', 
+    'ನಮಸ್ಕಾರ', 'ನಮಸ್ತೆ', 'vanakkam', 'adaab'
+]
+
+SALARY_WORDS = [
+    'salary', 'pay', 'compensation', 'money', 'earning', 'income', 'wage',
+    'salaries', 'earnings', 'wages',
+    'वेतन', 'तनख्वाह', 'पैसा', 'कमाई', 'ਤਨਖਾਹ', 'ਪੈਸਾ', 'ਕਮਾਈ',
+    'ಸಂಬಳ', 'ದುಡ್ಡು', 'ಕಮಾಯಿ', 'पगार', 'रुपया'
+]
+
+SKILLS_WORDS = [
+    'skills', 'learn', 'study', 'course', 'training', 'education', 'skill',
+    'learning', 'courses', 'studying',
+    'कौशल', 'सीखना', 'अध्ययन', 'पढ़ना', 'ਸਿੱਖਣਾ', 'ਹੁਨਰ', 'ਸਿੱਖਿਆ',
+    'ಕೌಶಲ್ಯ', 'ಕಲಿಕೆ', 'ಅಧ್ಯಯನ', 'शिकणे', 'कौशल्य'
+]
+
+INTERVIEW_WORDS = [
+    'interview', 'preparation', 'questions', 'tips', 'prep', 'question',
+    'interviews', 'interviewing',
+    'साक्षात्कार', 'इंटरव्यू', 'प्रश्न', 'ਇੰਟਰਵਿਊ', 'ਸਵਾਲ',
+    'ಸಂದರ್ಶನ', 'ಪ್ರಶ್ನೆ', 'मुलाखत'
+]
+
+JOB_WORDS = [
+    'job', 'career', 'work', 'employment', 'position', 'role', 'jobs',
+    'careers', 'positions', 'roles',
+    'नौकरी', 'काम', 'कैरियर', 'रोजगार', 'ਨੌਕਰੀ', 'ਕੰਮ', 'ਕਰੀਅਰ',
+    'ಕೆಲಸ', 'ನೌಕರಿ', 'ಕ್ಯಾರಿಯರ್', 'काम', 'नोकरी'
+]
+
+RESUME_WORDS = [
+    'resume', 'cv', 'biodata', 'profile', 'bio', 'resumes',
+    'बायोडाटा', 'रिज्यूमे', 'ਬਾਇਓਡਾਟਾ', 'ರೆಸ್ಯೂಮೆ', 'ಬಯೋಡಾಟಾ'
+]
+
+# Intents in priority order: the first intent with a matching keyword wins
+INTENT_KEYWORDS = [
+    ('greeting', GREETING_WORDS),
+    ('salary', SALARY_WORDS),
+    ('skills', SKILLS_WORDS),
+    ('interview', INTERVIEW_WORDS),
+    ('job', JOB_WORDS),
+    ('resume', RESUME_WORDS),
+]
+
+# Punctuation (including the Devanagari danda) becomes whitespace before tokenizing
+PUNCTUATION_TABLE = str.maketrans({char: ' ' for char in string.punctuation + '।॥'})
+
+def _phrase_pattern(phrases):
+    """Whole-phrase regex over the tokenized message, longest phrase first"""
+    if not phrases:
+        return None
+    alternation = '|'.join(
+        r'\s+'.join(map(re.escape, phrase.split()))
+        for phrase in sorted(phrases, key=len, reverse=True)
+    )
+    return re.compile(rf'(?<!\S)(?:{alternation})(?!\S)')
+
+def _build_intent_matchers():
+    """Per intent: a set of single-word keywords and a regex for multi-word phrases"""
+    matchers = []
+    claimed = set()
+    for intent, words in INTENT_KEYWORDS:
+        # A keyword already claimed by a higher-priority intent can never win here
+        reachable = [word for word in dict.fromkeys(words) if word not in claimed]
+        claimed.update(reachable)
+        matchers.append((
+            intent,
+            frozenset(word for word in reachable if ' ' not in word),
+            _phrase_pattern([word for word in reachable if ' ' in word]),
+        ))
+    return matchers
+
+INTENT_MATCHERS = _build_intent_matchers()
 
 def detect_intent_multilingual(user_message):
     """Detect what user is asking about in ANY language"""
-    message_lower = user_message.lower()
-    
-    # More comprehensive word lists
-    greeting_words = [
-        'hi', 'hello', 'hey', 'start', 'namaste', 'namaskar', 'hola', 'bonjour',
-        'नमस्ते', 'नमस्कार', 'ਸਤ ਸ੍ਰੀ ਅਕਾਲ', 'ਨਮਸਕਾਰ', 
-        'ನಮಸ್ಕಾರ', 'ನಮಸ್ತೆ', 'vanakkam', 'adaab'
-    ]
-    
-    salary_words = [
-        'salary', 'pay', 'compensation', 'money', 'earning', 'income', 'wage',
-        'वेतन', 'तनख्वाह', 'पैसा', 'कमाई', 'ਤਨਖਾਹ', 'ਪੈਸਾ', 'ਕਮਾਈ',
-        'ಸಂಬಳ', 'ದುಡ್ಡು', 'ಕಮಾಯಿ', 'पगार', 'रुपया'
-    ]
-    
-    skills_words = [
-        'skills', 'learn', 'study', 'course', 'training', 'education', 'skill',
-        'कौशल', 'सीखना', 'अध्ययन', 'पढ़ना', 'ਸਿੱਖਣਾ', 'ਹੁਨਰ', 'ਸਿੱਖਿਆ',
-        'ಕೌಶಲ್ಯ', 'ಕಲಿಕೆ', 'ಅಧ್ಯಯನ', 'शिकणे', 'कौशल्य'
-    ]
-    
-    interview_words = [
-        'interview', 'preparation', 'questions', 'tips', 'prep', 'question',
-        'साक्षात्कार', 'इंटरव्यू', 'प्रश्न', 'ਇੰਟਰਵਿਊ', 'ਸਵਾਲ',
-        'ಸಂದರ್ಶನ', 'ಪ್ರಶ್ನೆ', 'मुलाखत'
-    ]
-    
-    job_words = [
-        'job', 'career', 'work', 'employment', 'position', 'role', 'jobs',
-        'नौकरी', 'काम', 'कैरियर', 'रोजगार', 'ਨੌਕਰੀ', 'ਕੰਮ', 'ਕਰੀਅਰ',
-        'ಕೆಲಸ', 'ನೌಕರಿ', 'ಕ್ಯಾರಿಯರ್', 'काम', 'नोकरी'
-    ]
-    
-    resume_words = [
-        'resume', 'cv', 'biodata', 'profile', 'bio',
-        'बायोडाटा', 'रिज्यूमे', 'ਬਾਇਓਡਾਟਾ', 'ರೆಸ್ಯೂಮೆ', 'ಬಯೋಡಾಟಾ'
-    ]
+    message = user_message.lower().translate(PUNCTUATION_TABLE)
+    tokens = frozenset(message.split())
     
     # Check intent
-    if any(word in message_lower for word in greeting_words):
-        return 'greeting'
-    elif any(word in message_lower for word in salary_words):
-        return 'salary'  
-    elif any(word in message_lower for word in skills_words):
-        return 'skills'
-    elif any(word in message_lower for word in interview_words):
-        return 'interview'
-    elif any(word in message_lower for word in job_words):
-        return 'job'
-    elif any(word in message_lower for word in resume_words):
-        return 'resume'
-    else:
-        return 'default'
-
-def get_ai_response(user_message, language='en'):
-    """SUPER SMART multilingual responses"""
-    
-    print(f"🔍 Processing: {user_message}")
-    print(f"🌍 Language: {language}")
+    for intent, keywords, phrase_pattern in INTENT_MATCHERS:
+        if not keywords.isdisjoint(tokens) or (phrase_pattern and phrase_pattern.search(message)):
+            return intent
     
-    # Detect intent
-    intent = detect_intent_multilingual(user_message)
-    print(f"🎯 Detected intent: {intent}")
+    return 'default'
+
+# Static part of the fallback response, translated and cached like the others
+DEFAULT_PREFIX = """I help with:
+💼 Job search & career strategy
+💰 Salary data & negotiation  
+🎓 Tech skills & learning
+🎯 Interview preparation
+
+**Quick examples:**
+"Software engineer salary"
+"Skills for AI jobs"  
+"Google interview prep"
+
+What do you need help with?"""
+
+def _default_echo(user_message):
+    """First line of the fallback response, echoing the user's own words"""
+    return f'🤖 **Got it: "{user_message}"**'
+
+def _english_for_intent(intent, user_message):
+    """English response template for an intent"""
     
     # Shorter, cleaner responses to avoid translation limits
     if intent == 'greeting':
@@ -288,35 +535,72 @@ Apply within 24hrs, follow up in 1 week!"""
 Want help with specific sections?"""
 
     else:
-        english_response = f"""🤖 **Got it: "{user_message}"**
-
-I help with:
-💼 Job search & career strategy
-💰 Salary data & negotiation  
-🎓 Tech skills & learning
-🎯 Interview preparation
-
-**Quick examples:**
-"Software engineer salary"
-"Skills for AI jobs"  
-"Google interview prep"
+        english_response = f"{_default_echo(user_message)}\n\n{DEFAULT_PREFIX}"
+    
+    return english_response
 
-What do you need help with?"""
+# Intents whose responses don't depend on the user's message
+STATIC_INTENTS = ('greeting', 'salary', 'skills', 'interview', 'job', 'resume')
+
+# Translated static responses keyed by (intent, language)
+RESPONSES = {}
+
+# English static responses, for recognizing the bot's own text
+STATIC_ENGLISH_RESPONSES = frozenset(_english_for_intent(intent, '') for intent in STATIC_INTENTS)
+
+def is_known_response(text):
+    """Whether text is one of the bot's fixed responses, in English or translated"""
+    return text in STATIC_ENGLISH_RESPONSES or text in RESPONSES.values()
+
+def _translated_for_intent(intent, language):
+    """Translated static response (DEFAULT_PREFIX for default), memoized per (intent, language)"""
+    response = RESPONSES.get((intent, language))
+    if response is None:
+        english_response = DEFAULT_PREFIX if intent == 'default' else _english_for_intent(intent, '')
+        response, complete = translate_text_checked(english_response, language)
+        # Only pin fully translated responses; otherwise rebuild from the chunk cache next time
+        if complete:
+            RESPONSES[(intent, language)] = response
+    return response
+
+def warm_responses():
+    """Pre-translate every static response so no request pays for it"""
+    for intent in STATIC_INTENTS + ('default',):
+        for language in LANGUAGES:
+            if language != 'en':
+                _translated_for_intent(intent, language)
+    logger.info("✅ Pre-translated %d responses", len(RESPONSES))
+
+def get_ai_response(user_message, language='en', intent=None):
+    """SUPER SMART multilingual responses"""
     
-    # Translate if not English
-    if language != 'en':
-        try:
-            translated_response = translate_text_smart(english_response, language)
-            print(f"✅ Translated to {language}")
-            return translated_response
-        except Exception as e:
-            print(f"❌ Translation error: {e}")
-            return english_response
+    logger.debug("🔍 Processing: %s", user_message)
+    logger.debug("🌍 Language: %s", language)
     
-    return english_response
+    # Detect intent unless the caller already did
+    if intent is None:
+        intent = detect_intent_multilingual(user_message)
+    logger.debug("🎯 Detected intent: %s", intent)
+    
+    if language == 'en':
+        return _english_for_intent(intent, user_message)
+    
+    # Translate if not English
+    try:
+        # Only the static part of the default response is translated; the echo is the user's own words
+        if intent == 'default':
+            translated_response = f"{_default_echo(user_message)}\n\n{_translated_for_intent(intent, language)}"
+        else:
+            translated_response = _translated_for_intent(intent, language)
+        logger.debug("✅ Translated to %s", language)
+        return translated_response
+    except Exception as e:
+        logger.error("❌ Translation error: %s", e)
+        return _english_for_intent(intent, user_message)
 
-def generate_smart_suggestions(user_message, ai_response, language='en'):
-    intent = detect_intent_multilingual(user_message)
+def generate_smart_suggestions(user_message, ai_response, language='en', intent=None):
+    if intent is None:
+        intent = detect_intent_multilingual(user_message)
     
     if intent == 'skills':
         return ['🐍 Python learning roadmap', '🤖 AI/ML fundamentals', '☁️ Cloud platforms guide', '💻 Full-stack development']
@@ -329,55 +613,56 @@ def generate_smart_suggestions(user_message, ai_response, language='en'):
     else:
         return ['💼 Career guidance', '📈 Skill development', '💰 Salary information', '🎤 Interview preparation']
 
+def json_response(payload, status=200):
+    """JSON response serialized with orjson, keeping non-ASCII text as raw UTF-8"""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+@app.errorhandler(HTTPException)
+def handle_http_error(e):
+    return json_response({'success': False, 'error': e.description}, e.code)
+
 @app.route('/')
 def home():
-    return jsonify({"message": "🚀 CareerMate AI Job Assistant - Backend Running!"})
+    return json_response({"message": "🚀 CareerMate AI Job Assistant - Backend Running!"})
 
 @app.route('/web') 
 def web_interface():
     try:
-        with open('templates/index.html', 'r', encoding='utf-8') as f:
-            return f.read()
+        # Served with sendfile, an ETag and a 5 minute browser cache
+        return send_from_directory('templates', 'index.html', max_age=300)
     except Exception as e:
         return f"Error loading web interface: {str(e)}"
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data())
         user_message = data.get('message', '').strip()
         language = data.get('language', 'en')
         
-        print(f"🔍 Received: '{user_message}'")
-        print(f"🌍 Language: {language}")
-        print(f"📏 Message length: {len(user_message)} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Received: '%s'", user_message)
+            logger.debug("🌍 Language: %s", language)
+            logger.debug("📏 Message length: %d chars", len(user_message))
         
         # Handle empty messages
         if not user_message:
-            return jsonify({"success": False, "error": "Empty message received"}), 400
+            return json_response({"success": False, "error": "Empty message received"}, 400)
         
         # Clean up the message
         user_message = ' '.join(user_message.split())
         
-        bot_response = get_ai_response(user_message, language)
-        suggestions = generate_smart_suggestions(user_message, bot_response, language)
+        intent = detect_intent_multilingual(user_message)
+        bot_response = get_ai_response(user_message, language, intent=intent)
+        suggestions = generate_smart_suggestions(user_message, bot_response, language, intent=intent)
         
-        print(f"🤖 Response generated!")
-        print(f"📏 Response length: {len(bot_response)} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🤖 Response generated!")
+            logger.debug("📏 Response length: %d chars", len(bot_response))
         
-        try:
-            conn = get_db_connection()
-            if conn:
-                conn.execute(
-                    'INSERT INTO chats (user_message, bot_response, timestamp) VALUES (?, ?, ?)',
-                    (user_message, bot_response, datetime.now().isoformat())
-                )
-                conn.commit()
-                conn.close()
-        except Exception as db_error:
-            print(f"❌ Database error: {db_error}")
+        save_chat(user_message, bot_response, datetime.now().isoformat())
         
-        return jsonify({
+        return json_response({
             "success": True,
             "response": bot_response,
             "suggestions": suggestions,
@@ -386,39 +671,54 @@ def chat():
         })
         
     except Exception as e:
-        print(f"❌ Chat error: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        logger.error("❌ Chat error: %s", e)
+        return json_response({"success": False, "error": str(e)}, 500)
 
 @app.route('/api/speak', methods=['POST'])
 def text_to_speech():
     try:
-        data = request.get_json()
+        data = orjson.loads(request.get_data())
         text = data.get('text', '')
         language = data.get('language', 'en')
         
         lang_config = LANGUAGES.get(language, LANGUAGES['en'])
         tts_lang = lang_config['tts_lang']
         
+        # Reuse previously synthesized audio for the same text and voice. Only the
+        # bot's fixed responses are cached, so clients can't fill the disk.
+        cache_path = None
+        if is_known_response(text):
+            text_hash = hashlib.blake2b(f'{tts_lang}|{text}'.encode(), digest_size=16).hexdigest()
+            cache_path = os.path.join(TTS_CACHE_DIR, f'{text_hash}.mp3')
+            if os.path.exists(cache_path):
+                return send_file(cache_path, as_attachment=True, download_name=f'speech_{language}.mp3', mimetype='audio/mpeg')
+        
+        # Synthesize in memory and send it; fill the cache once the response is done
         tts = gTTS(text=text, lang=tts_lang, slow=False)
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-        tts.save(temp_file.name)
+        buf = io.BytesIO()
+        tts.write_to_fp(buf)
+        audio = buf.getvalue()
+        buf.seek(0)
         
-        return send_file(temp_file.name, as_attachment=True, download_name=f'speech_{language}.mp3', mimetype='audio/mpeg')
+        response = send_file(buf, as_attachment=True, download_name=f'speech_{language}.mp3', mimetype='audio/mpeg')
+        if cache_path:
+            response.call_on_close(lambda: save_tts_cache(cache_path, audio))
+        return response
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
     try:
         if 'resume' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'}), 400
+            return json_response({'success': False, 'error': 'No file uploaded'}, 400)
         
         file = request.files['resume']
         if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'}), 400
+            return json_response({'success': False, 'error': 'No file selected'}, 400)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': f'📄 Resume "{file.filename}" uploaded successfully! I can help you optimize it and find matching job opportunities.',
             'analysis': {
@@ -435,12 +735,15 @@ def upload_resume():
         })
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return json_response({'success': False, 'error': str(e)}, 500)
 
 if __name__ == '__main__':
+    logging.basicConfig(format='%(message)s')
     print("🚀 Starting CareerMate AI Job Assistant...")
     print("🤖 Initializing database...")
     init_database()
+    print("🌐 Pre-translating responses...")
+    warm_responses()
     print("🌍 CareerMate Backend Started!")
     print("🗣️ Voice support enabled!")
     print("🔥 Smart translation active!")
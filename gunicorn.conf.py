@@ -0,0 +1,48 @@
+# Production server config: gunicorn -c gunicorn.conf.py app:app
+#
+# gevent workers run each request in a greenlet, so the network I/O on the
+# chat path (MyMemory calls, gTTS) yields to other requests instead of
+# pinning an OS thread per in-flight translation. sqlite3 is a C extension
+# and can't be made cooperative; app.run_blocking sends the SQLite work to
+# gevent's native threadpool so it doesn't stall the worker.
+import multiprocessing
+import os
+import subprocess
+import sys
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
+timeout = 60
+
+# The gunicorn master reaps every child through waitpid(-1), so the warm-up
+# must always exit 0: a non-zero code would be logged as a crashed worker,
+# and codes 3/4 would halt the server. Its own errors go to its stderr.
+WARM_UP_SCRIPT = '''
+import os, traceback
+try:
+    import app
+    app.warm_responses()
+except BaseException:
+    traceback.print_exc()
+finally:
+    os._exit(0)
+'''
+
+_warm_up_process = None
+
+def on_starting(server):
+    # The master must not import the app (workers have to import it after
+    # gevent patches the stdlib), so startup work runs in child processes.
+    # Tables are created before any worker boots. The warm-up then fills
+    # the SQLite chunk cache once in the background, rather than in every
+    # worker at boot, and workers fill their RESPONSES lazily from it.
+    global _warm_up_process
+    subprocess.run([sys.executable, '-c', 'import app; app.init_database()'], check=False)
+    _warm_up_process = subprocess.Popen([sys.executable, '-c', WARM_UP_SCRIPT])
+
+def on_exit(server):
+    # Don't leave the warm-up running after the master shuts down
+    if _warm_up_process is not None and _warm_up_process.poll() is None:
+        _warm_up_process.terminate()